@@ -20,11 +20,39 @@ import signal
 import sys
 import subprocess
 import os
+import random
+import socket
 import struct
 from typing import Set, Optional
 from dataclasses import dataclass
 
 
+# Length prefix framing: big-endian 4-byte unsigned int
+_LEN_STRUCT = struct.Struct('>I')
+
+# Limits for coalescing framed UDP datagrams into a single TCP write
+_FLUSH_MAX_BYTES = 60000
+_FLUSH_MAX_MESSAGES = 43
+_FLUSH_INTERVAL = 0.0005  # seconds
+
+# UDP receive tuning
+_MAX_DATAGRAM_SIZE = 65535
+_RECV_BATCH = 64  # datagrams read per readiness callback
+_UDP_RCVBUF = 8 * 1024 * 1024
+
+# Upper bound for the jittered exponential reconnect backoff (seconds)
+_RECONNECT_MAX_DELAY = 60.0
+
+# TCP keepalive settings: probe after 10s idle, every 5s, drop after 3 misses,
+# and give up on unacknowledged data after 30s
+_TCP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 10),
+    ("TCP_KEEPINTVL", 5),
+    ("TCP_KEEPCNT", 3),
+    ("TCP_USER_TIMEOUT", 30000),
+)
+
+
 @dataclass
 class Config:
     """Configuration for the gateway service."""
@@ -44,9 +72,24 @@ class UDPToTCPGateway:
         self.config = config
         self.tcp_writer: Optional[asyncio.StreamWriter] = None
         self.tcp_reader: Optional[asyncio.StreamReader] = None
-        self.udp_transport: Optional[asyncio.DatagramTransport] = None
+        self.udp_socket: Optional[socket.socket] = None
         self.logger = self._setup_logging()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._connection_task: Optional[asyncio.Task] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_event = asyncio.Event()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._pending = bytearray()
+        self._pending_count = 0
+        # Single receive buffer large enough for any UDP payload
+        self._recv_buf = memoryview(bytearray(_MAX_DATAGRAM_SIZE))
+        # python-iptables module (None until probed, False if unusable)
+        self._iptc = None
+        self._iptc_table = None
+        self._tcp_sock: Optional[socket.socket] = None
+        self._corked = False
+        # Datagram handler, swapped as the TCP connection comes and goes
+        self._handle = self._handle_noop
         self._shutdown = False
         
     def _setup_logging(self) -> logging.Logger:
@@ -59,19 +102,20 @@ class UDPToTCPGateway:
     
     async def start(self):
         """Start the gateway service."""
-        self.logger.info(f"Starting broadcast gateway: UDP:{self.config.udp_port} -> TCP:{self.config.tcp_host}:{self.config.tcp_port}")
+        self.logger.info("Starting broadcast gateway: UDP:%d -> TCP:%s:%d",
+                         self.config.udp_port, self.config.tcp_host, self.config.tcp_port)
         
         if self.config.enable_firewall:
             await self._setup_firewall()
         
         # Start UDP listener first
-        loop = asyncio.get_event_loop()
-        self.udp_transport, _ = await loop.create_datagram_endpoint(
-            lambda: UDPProtocol(self),
-            local_addr=(self.config.bind_address, self.config.udp_port),
-            reuse_port=True
-        )
-        self.logger.info(f"UDP listener started on {self.config.bind_address}:{self.config.udp_port}")
+        self._loop = asyncio.get_running_loop()
+        self.udp_socket = self._create_udp_socket()
+        self._loop.add_reader(self.udp_socket.fileno(), self._on_udp_readable)
+        self.logger.info("UDP listener started on %s:%d", self.config.bind_address, self.config.udp_port)
+        
+        # Start the single background flusher that drains the TCP writer
+        self._flusher = asyncio.create_task(self._flush_loop())
         
         # Start connection to TCP endpoint
         self._connection_task = asyncio.create_task(self._maintain_tcp_connection())
@@ -81,13 +125,19 @@ class UDPToTCPGateway:
         self.logger.info("Stopping broadcast gateway...")
         self._shutdown = True
         
-        # Cancel connection task
-        if self._connection_task:
-            self._connection_task.cancel()
-            try:
-                await self._connection_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel connection and flusher tasks
+        for task in (self._connection_task, self._flusher):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        # Forward anything still waiting in the coalescing buffer
+        self._handle = self._handle_noop
+        self._flush_pending()
+        self._set_cork(False)
         
         # Close TCP connection
         if self.tcp_writer and not self.tcp_writer.is_closing():
@@ -97,63 +147,90 @@ class UDPToTCPGateway:
             except Exception:
                 pass
         
-        # Close UDP transport
-        if self.udp_transport:
-            self.udp_transport.close()
+        # Close UDP listener
+        if self.udp_socket:
+            self._loop.remove_reader(self.udp_socket.fileno())
+            self.udp_socket.close()
+            self.udp_socket = None
         
         if self.config.enable_firewall:
             await self._cleanup_firewall()
         
         self.logger.info("Gateway stopped")
     
+    def _create_udp_socket(self) -> socket.socket:
+        """Create the non-blocking UDP socket used to receive broadcasts."""
+        # Resolve the bind address so both IPv4 and IPv6 addresses work
+        family, type_, proto, _, sockaddr = socket.getaddrinfo(
+            self.config.bind_address, self.config.udp_port,
+            type=socket.SOCK_DGRAM, flags=socket.AI_PASSIVE
+        )[0]
+        sock = socket.socket(family, type_, proto)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # Larger receive buffer so bursts are not dropped between reads
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _UDP_RCVBUF)
+            sock.bind(sockaddr)
+            sock.setblocking(False)
+        except BaseException:
+            sock.close()
+            raise
+        
+        # Linux caps the request at net.core.rmem_max and reports double the value
+        rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) // 2
+        if rcvbuf < _UDP_RCVBUF:
+            self.logger.warning("UDP receive buffer limited to %d bytes; raise net.core.rmem_max to allow %d",
+                                rcvbuf, _UDP_RCVBUF)
+        return sock
+    
+    def _on_udp_readable(self):
+        """Read the datagrams queued on the UDP socket in one callback."""
+        buf = self._recv_buf
+        recvfrom_into = self.udp_socket.recvfrom_into
+        for _ in range(_RECV_BATCH):
+            try:
+                nbytes, addr = recvfrom_into(buf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self.logger.error("UDP error: %s", e)
+                return
+            # The handler copies the datagram out before the buffer is reused
+            self._handle(buf[:nbytes], addr)
+    
     async def _maintain_tcp_connection(self):
         """Maintain connection to the TCP endpoint with auto-reconnect."""
+        attempt = 0
         while not self._shutdown:
             try:
-                self.logger.info(f"Connecting to TCP endpoint: {self.config.tcp_host}:{self.config.tcp_port}")
+                self.logger.info("Connecting to TCP endpoint: %s:%d", self.config.tcp_host, self.config.tcp_port)
                 self.tcp_reader, self.tcp_writer = await asyncio.open_connection(
                     self.config.tcp_host, 
                     self.config.tcp_port
                 )
-                self.logger.info(f"Connected to TCP endpoint: {self.config.tcp_host}:{self.config.tcp_port}")
+                self.logger.info("Connected to TCP endpoint: %s:%d", self.config.tcp_host, self.config.tcp_port)
+                attempt = 0
                 
-                # Create a task to detect when the connection is closed by the remote end
-                # We'll use a simple approach: try to read from the connection.
-                # If it returns empty data or raises an exception, the connection is closed.
-                async def connection_watcher():
-                    try:
-                        # Just wait for the connection to close naturally
-                        while not self._shutdown and not self.tcp_writer.is_closing():
-                            # Try to read - this will fail when connection closes
-                            try:
-                                data = await asyncio.wait_for(self.tcp_reader.read(1), timeout=1.0)
-                                if not data:  # EOF - connection closed
-                                    break
-                            except asyncio.TimeoutError:
-                                continue  # No data, but connection still alive
-                            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
-                                break  # Connection closed
-                    except Exception:
-                        pass  # Connection closed
+                self._configure_tcp_socket(self.tcp_writer)
+                self._handle = self._handle_connected
                 
-                # Wait for the connection watcher to complete (which means connection closed)
-                watcher_task = asyncio.create_task(connection_watcher())
+                # Wait for the endpoint to close the connection. The read only
+                # wakes on EOF or error; dead peers are detected by the kernel
+                # through TCP keepalive and TCP_USER_TIMEOUT.
                 try:
-                    await watcher_task
-                except asyncio.CancelledError:
-                    watcher_task.cancel()
-                    try:
-                        await watcher_task
-                    except asyncio.CancelledError:
-                        pass
-                    break
+                    while await self.tcp_reader.read(65536):
+                        pass  # The endpoint is not expected to send anything
+                except (ConnectionError, OSError) as e:
+                    self.logger.warning("TCP connection error: %s", e)
                     
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Failed to connect to TCP endpoint {self.config.tcp_host}:{self.config.tcp_port}: {e}")
+                self.logger.error("Failed to connect to TCP endpoint %s:%d: %s",
+                                  self.config.tcp_host, self.config.tcp_port, e)
             
             # Clean up current connection
+            self._handle = self._handle_noop
             if self.tcp_writer and not self.tcp_writer.is_closing():
                 self.tcp_writer.close()
                 try:
@@ -163,47 +240,124 @@ class UDPToTCPGateway:
             
             self.tcp_reader = None
             self.tcp_writer = None
+            self._tcp_sock = None
+            self._corked = False
             
             if not self._shutdown:
-                self.logger.info(f"Connection lost, retrying in {self.config.reconnect_delay} seconds...")
-                await asyncio.sleep(self.config.reconnect_delay)
+                # Exponential backoff with full jitter so that several gateways
+                # do not reconnect to the endpoint in lockstep
+                attempt += 1
+                backoff = self.config.reconnect_delay * (2 ** min(attempt, 6))
+                delay = random.uniform(0, min(_RECONNECT_MAX_DELAY, backoff))
+                self.logger.info("Connection lost, retrying in %.2f seconds...", delay)
+                await asyncio.sleep(delay)
     
-    def handle_udp_message(self, data: bytes, addr):
-        """Handle incoming UDP broadcast message."""
-        if not self.tcp_writer or self.tcp_writer.is_closing():
-            # No TCP connection active, skip message
-            self.logger.debug(f"UDP message from {addr} dropped - no TCP connection")
+    def _configure_tcp_socket(self, writer: asyncio.StreamWriter):
+        """Tune segmenting and kernel-level dead peer detection on the TCP connection."""
+        sock = writer.get_extra_info('socket')
+        if sock is None:
             return
+        self._tcp_sock = sock
         
-        self.logger.debug(f"UDP message from {addr}: {len(data)} bytes")
+        try:
+            # Send each flushed batch immediately instead of waiting on Nagle
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for name, value in _TCP_KEEPALIVE_OPTIONS:
+                # Not every platform provides all of these options
+                if hasattr(socket, name):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+        except OSError as e:
+            self.logger.warning("Could not configure TCP socket options: %s", e)
+    
+    def _handle_noop(self, data: memoryview, addr):
+        """Drop an incoming UDP broadcast message while no TCP connection is active."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("UDP message from %s dropped - no TCP connection", addr)
+    
+    def _handle_connected(self, data: memoryview, addr):
+        """Frame an incoming UDP broadcast message for the connected TCP endpoint."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("UDP message from %s: %d bytes", addr, len(data))
         
-        # Create message with length prefix to preserve boundaries
+        # Append message with length prefix to preserve boundaries
         # Format: [4-byte length][message data]
-        message_length = len(data)
-        length_prefix = struct.pack('>I', message_length)  # Big-endian 4-byte unsigned int
-        message_with_boundary = length_prefix + data
+        self._pending += _LEN_STRUCT.pack(len(data))
+        self._pending += data
+        self._pending_count += 1
+        
+        # Forward once the batch is full, otherwise within a short window
+        if len(self._pending) >= _FLUSH_MAX_BYTES or self._pending_count >= _FLUSH_MAX_MESSAGES:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(_FLUSH_INTERVAL, self._flush_pending)
+    
+    def _flush_pending(self):
+        """Write the coalesced datagrams to the TCP endpoint in one call."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
-        # Forward to TCP endpoint with better error handling
+        if not self._pending:
+            return
+        
+        # Hand the buffer itself to the transport and start a fresh one,
+        # rather than copying it into an intermediate bytes object
+        batch = self._pending
+        self._pending = bytearray()
+        self._pending_count = 0
+        
+        if not self.tcp_writer or self.tcp_writer.is_closing():
+            self.logger.debug("Dropped %d buffered bytes - no TCP connection", len(batch))
+            return
+        
+        # Forward to TCP endpoint; the background flusher drains the writer.
+        # A batch is already one send(), so only cork when the transport is
+        # backlogged and several batches may go out together; the flusher
+        # uncorks once drained.
         try:
-            self.tcp_writer.write(message_with_boundary)
-            # Don't create a separate task for draining - do it synchronously to avoid race conditions
-            asyncio.create_task(self._drain_writer_safe(self.tcp_writer))
+            if not self._corked and self.tcp_writer.transport.get_write_buffer_size():
+                self._set_cork(True)
+            self.tcp_writer.write(batch)
+            self._flush_event.set()
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
-            self.logger.warning(f"TCP connection lost while forwarding message: {e}")
+            self.logger.warning("TCP connection lost while forwarding message: %s", e)
             # Mark the connection as closing so it will be cleaned up
-            if self.tcp_writer:
-                self.tcp_writer.close()
+            self._handle = self._handle_noop
+            self.tcp_writer.close()
         except Exception as e:
-            self.logger.warning(f"Error forwarding UDP message to TCP endpoint: {e}")
+            self.logger.warning("Error forwarding UDP message to TCP endpoint: %s", e)
     
-    async def _drain_writer_safe(self, writer: asyncio.StreamWriter):
-        """Safely drain a writer and handle connection errors."""
+    async def _flush_loop(self):
+        """Drain the TCP writer whenever data has been buffered.
+        
+        A single long-lived task coalesces the drains for many forwarded
+        datagrams instead of spawning one drain task per packet.
+        """
+        while not self._shutdown:
+            await self._flush_event.wait()
+            self._flush_event.clear()
+            writer = self.tcp_writer
+            if not writer or writer.is_closing():
+                continue
+            try:
+                await writer.drain()
+            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
+                self.logger.debug("Connection lost during drain: %s", e)
+            except Exception as e:
+                self.logger.warning("Error draining writer: %s", e)
+            if self._corked:
+                self._set_cork(False)
+    
+    def _set_cork(self, enabled: bool):
+        """Toggle TCP_CORK on the TCP connection where the platform supports it."""
+        if self._tcp_sock is None or not hasattr(socket, 'TCP_CORK'):
+            return
         try:
-            await writer.drain()
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
-            self.logger.debug(f"Connection lost during drain: {e}")
-        except Exception as e:
-            self.logger.warning(f"Error draining writer: {e}")
+            self._tcp_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(enabled))
+            self._corked = enabled
+        except OSError as e:
+            self.logger.debug("Could not set TCP_CORK: %s", e)
     
     async def _setup_firewall(self):
         """Set up iptables rules for UDP broadcasts."""
@@ -211,23 +365,14 @@ class UDPToTCPGateway:
             self.logger.warning("Not running as root, cannot configure iptables")
             return
         
-        rules = [
-            f"iptables -I INPUT -p udp --dport {self.config.udp_port} -j ACCEPT",
-            f"iptables -I FORWARD -p udp --dport {self.config.udp_port} -j ACCEPT"
-        ]
-        
-        if self.config.firewall_interface != "any":
-            rules = [
-                f"iptables -I INPUT -i {self.config.firewall_interface} -p udp --dport {self.config.udp_port} -j ACCEPT",
-                f"iptables -I FORWARD -i {self.config.firewall_interface} -p udp --dport {self.config.udp_port} -j ACCEPT"
-            ]
-        
-        for rule in rules:
-            try:
-                result = subprocess.run(rule.split(), check=True, capture_output=True, text=True)
-                self.logger.info(f"Added firewall rule: {rule}")
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"Failed to add firewall rule '{rule}': {e}")
+        rules = self._firewall_rules("-I")
+        errors = self._firewall_errors()
+        try:
+            self._apply_firewall_rules("-I")
+            for rule in rules:
+                self.logger.info("Added firewall rule: iptables %s", rule)
+        except errors as e:
+            self.logger.error("Failed to add firewall rules %s: %s", rules, getattr(e, 'stderr', None) or e)
     
     async def _cleanup_firewall(self):
         """Remove iptables rules."""
@@ -235,24 +380,96 @@ class UDPToTCPGateway:
             self.logger.warning("Not running as root, cannot clean up iptables")
             return
         
-        rules = [
-            f"iptables -D INPUT -p udp --dport {self.config.udp_port} -j ACCEPT",
-            f"iptables -D FORWARD -p udp --dport {self.config.udp_port} -j ACCEPT"
-        ]
-        
+        rules = self._firewall_rules("-D")
+        errors = self._firewall_errors()
+        try:
+            self._apply_firewall_rules("-D")
+            for rule in rules:
+                self.logger.info("Removed firewall rule: iptables %s", rule)
+        except errors as e:
+            # Rules might not exist, that's okay
+            self.logger.debug("Could not remove firewall rules %s: %s", rules, getattr(e, 'stderr', None) or e)
+    
+    def _firewall_rules(self, action: str) -> list:
+        """Build the iptables rule specs for the UDP port with the given action."""
+        match = f"-p udp --dport {self.config.udp_port} -j ACCEPT"
         if self.config.firewall_interface != "any":
-            rules = [
-                f"iptables -D INPUT -i {self.config.firewall_interface} -p udp --dport {self.config.udp_port} -j ACCEPT",
-                f"iptables -D FORWARD -i {self.config.firewall_interface} -p udp --dport {self.config.udp_port} -j ACCEPT"
-            ]
+            match = f"-i {self.config.firewall_interface} {match}"
+        return [f"{action} {chain} {match}" for chain in ("INPUT", "FORWARD")]
+    
+    def _apply_firewall_rules(self, action: str):
+        """Insert (-I) or delete (-D) the gateway's rules in the filter table.
         
-        for rule in rules:
+        Uses python-iptables in-process on hosts with the legacy iptables
+        backend, otherwise a single iptables-restore invocation.
+        """
+        iptc = self._load_iptc()
+        if iptc:
+            self._apply_iptc_rules(iptc, action)
+        else:
+            self._restore_firewall_rules(self._firewall_rules(action))
+    
+    def _firewall_errors(self) -> tuple:
+        """Return the exceptions raised by the firewall backend in use."""
+        iptc = self._load_iptc()
+        if iptc:
+            return (subprocess.CalledProcessError, iptc.IPTCError)
+        return (subprocess.CalledProcessError,)
+    
+    def _load_iptc(self):
+        """Import python-iptables if it can manage this host's ruleset.
+        
+        libiptc only writes legacy x_tables, which iptables-nft hosts ignore,
+        so it is used only when iptables reports the legacy backend.
+        """
+        if self._iptc is None:
+            self._iptc = False
+            try:
+                import iptc
+            except Exception:  # python-iptables not installed or libxtables unavailable
+                return None
+            # Only probe the backend when python-iptables is actually usable
             try:
-                result = subprocess.run(rule.split(), check=True, capture_output=True, text=True)
-                self.logger.info(f"Removed firewall rule: {rule}")
-            except subprocess.CalledProcessError as e:
-                # Rule might not exist, that's okay
-                self.logger.debug(f"Could not remove firewall rule '{rule}': {e}")
+                result = subprocess.run(["iptables", "--version"], check=True, capture_output=True, text=True)
+            except (OSError, subprocess.CalledProcessError):
+                return None
+            if "(legacy)" not in result.stdout:
+                return None
+            self._iptc = iptc
+        return self._iptc or None
+    
+    def _apply_iptc_rules(self, iptc, action: str):
+        """Apply the gateway's rules through libiptc in a single commit."""
+        if self._iptc_table is None:
+            self._iptc_table = iptc.Table(iptc.Table.FILTER, autocommit=False)
+        table = self._iptc_table
+        # Discard any stale state and load the current ruleset
+        table.refresh()
+        
+        for chain_name in ("INPUT", "FORWARD"):
+            rule = iptc.Rule()
+            rule.protocol = "udp"
+            if self.config.firewall_interface != "any":
+                rule.in_interface = self.config.firewall_interface
+            match = rule.create_match("udp")
+            match.dport = str(self.config.udp_port)
+            rule.create_target("ACCEPT")
+            
+            chain = iptc.Chain(table, chain_name)
+            if action == "-I":
+                chain.insert_rule(rule)
+            else:
+                chain.delete_rule(rule)
+        
+        table.commit()
+    
+    def _restore_firewall_rules(self, rules: list):
+        """Apply rules to the filter table in a single iptables-restore commit."""
+        script = "*filter\n" + "\n".join(rules) + "\nCOMMIT\n"
+        subprocess.run(
+            ["iptables-restore", "--noflush"],
+            input=script, check=True, capture_output=True, text=True
+        )
 
 
 async def read_length_prefixed_message(reader: asyncio.StreamReader) -> Optional[bytes]:
@@ -275,7 +492,7 @@ async def read_length_prefixed_message(reader: asyncio.StreamReader) -> Optional
         return None
     
     # Unpack the length (big-endian 4-byte unsigned int)
-    message_length = struct.unpack('>I', length_data)[0]
+    message_length = _LEN_STRUCT.unpack(length_data)[0]
     
     # Read the message data
     message_data = await reader.readexactly(message_length)
@@ -283,29 +500,6 @@ async def read_length_prefixed_message(reader: asyncio.StreamReader) -> Optional
     return message_data
 
 
-class UDPProtocol(asyncio.DatagramProtocol):
-    """Protocol class for handling UDP datagrams."""
-    
-    def __init__(self, gateway: UDPToTCPGateway):
-        self.gateway = gateway
-    
-    def connection_made(self, transport):
-        """Called when a connection is made."""
-        self.gateway.logger.debug("UDP connection made")
-    
-    def connection_lost(self, exc):
-        """Called when the connection is lost or closed."""
-        self.gateway.logger.debug(f"UDP connection lost: {exc}")
-    
-    def datagram_received(self, data: bytes, addr):
-        """Called when a UDP datagram is received."""
-        self.gateway.handle_udp_message(data, addr)
-    
-    def error_received(self, exc):
-        """Called when a UDP error occurs."""
-        self.gateway.logger.error(f"UDP error: {exc}")
-
-
 async def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='UDP to TCP Broadcast Gateway')
@@ -315,7 +509,7 @@ async def main():
     parser.add_argument('--bind-address', default='0.0.0.0', help='Address to bind UDP listener to')
     parser.add_argument('--enable-firewall', action='store_true', help='Enable iptables firewall rules')
     parser.add_argument('--firewall-interface', default='any', help='Network interface for firewall rules')
-    parser.add_argument('--reconnect-delay', type=float, default=5.0, help='Delay between reconnection attempts (seconds)')
+    parser.add_argument('--reconnect-delay', type=float, default=5.0, help='Base delay for reconnection backoff (seconds)')
     
     args = parser.parse_args()
     
@@ -349,11 +543,17 @@ async def main():
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        logging.error("Unexpected error: %s", e)
         sys.exit(1)
     finally:
         await gateway.stop()
 
 
 if __name__ == '__main__':
+    # Use uvloop when it is installed; fall back to the stock event loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())